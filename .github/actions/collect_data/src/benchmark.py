@@ -4,57 +4,89 @@
 
 import math
 import os
-import pathlib
-import json
+import re
+from collections import defaultdict
+from functools import partial
 from loguru import logger
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from pydantic_models import BenchmarkMeasurement, CompleteBenchmarkRun
-from shared import failure_happened
+from shared import failure_happened, validate_rows
+from utils import load_json_file, parallel_imap, walk_files
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Dict, Iterator, List
 
 """
 Generate benchmark data from perf reports.
 """
 
+# Job ID is the trailing number of the report name: `<report_name>_<job_id>.json`
+_REPORT_JOB_ID_RE = re.compile(r"(?:^|[._])(\d+)\.json\Z")
 
-def _load_model_spec_json(model_spec_path: pathlib.Path) -> dict | None:
+# Validates a whole list of measurement rows in a single pydantic-core call
+_MEASUREMENTS_ADAPTER = TypeAdapter(List[BenchmarkMeasurement])
+
+
+def _load_model_spec_json(model_spec_path: str) -> dict | None:
     """
     HINT: Temporary helper method to load model_spec JSON for Shield benchmarks.
     model_spec is not yet integrated into the main report schema.
     Until then, we load it separately from here.
     """
     try:
-        with open(model_spec_path) as model_spec_file:
-            model_spec_data = json.load(model_spec_file)
-            return model_spec_data
+        return load_json_file(model_spec_path)
     except Exception as e:
         logger.error(f"Failed to load model_spec from {model_spec_path}: {e}")
         return None
 
 
+def _report_measurement_error(fields: dict, error: ValidationError) -> None:
+    logger.error(
+        f"Validation error while creating BenchmarkMeasurement for key '{fields['name']}' "
+        f"with value {fields['value']!r}: {error}",
+        exc_info=True,
+    )
+
+
 def create_json_from_report(pipeline, workflow_outputs_dir) -> List[CompleteBenchmarkRun]:
+    return list(iter_benchmark_runs(pipeline, workflow_outputs_dir))
 
-    results = []
+
+def iter_benchmark_runs(pipeline, workflow_outputs_dir) -> Iterator[CompleteBenchmarkRun]:
+    """
+    Yields benchmark runs for all perf reports of the pipeline, ordered by
+    github_job_id descending and by report within a job, which is the order
+    the benchmark JSONL file is written in.
+    """
+    work_items = []
     reports = _get_model_reports(workflow_outputs_dir, pipeline.github_pipeline_id)
-    for job_id, report_paths in reports.items():
+    for job_id, report_paths in sorted(reports.items(), key=lambda item: item[0], reverse=True):
         # First, find and load model_spec file if it exists
         model_spec_data = None
-        model_spec_path = next((path for path in report_paths if "model_spec" in path.name), None)
+        model_spec_path = next((path for path in report_paths if "model_spec" in os.path.basename(path)), None)
         if model_spec_path:
             report_paths.remove(model_spec_path)
             model_spec_data = _load_model_spec_json(model_spec_path)
         if model_spec_data:
             logger.info(f"Loaded model_spec for job: {job_id} from {model_spec_path}")
 
-        for report_path in report_paths:
-            with open(report_path) as report_file:
-                report_data = json.load(report_file)
-                benchmark_data = _map_benchmark_data(pipeline, job_id, report_data, model_spec_data)
-                if benchmark_data:
-                    results.extend(benchmark_data)
-                    logger.info(f"Created benchmark data for job: {job_id} from report: {report_path}")
-    return results
+        work_items.extend((job_id, report_path, model_spec_data) for report_path in report_paths)
+
+    # Mappers only read job metadata, so drop the parsed tests before the
+    # pipeline is shipped to worker processes.
+    pipeline = pipeline.model_copy(update={"jobs": [job.model_copy(update={"tests": []}) for job in pipeline.jobs]})
+    jobs_by_id = {job.github_job_id: job for job in pipeline.jobs}
+    mapped = parallel_imap(partial(_map_report_file, pipeline, jobs_by_id), work_items)
+
+    for (job_id, report_path, _), benchmark_data in zip(work_items, mapped):
+        if benchmark_data:
+            yield from benchmark_data
+            logger.info(f"Created benchmark data for job: {job_id} from report: {report_path}")
+
+
+def _map_report_file(pipeline, jobs_by_id, work_item) -> List[CompleteBenchmarkRun] | None:
+    job_id, report_path, model_spec_data = work_item
+    report_data = load_json_file(report_path)
+    return _map_benchmark_data(pipeline, job_id, report_data, model_spec_data, jobs_by_id)
 
 
 def get_benchmark_filename(report) -> str:
@@ -62,44 +94,47 @@ def get_benchmark_filename(report) -> str:
     return f"benchmark_{report.github_pipeline_id}_{ts}.jsonl"
 
 
-def _get_model_reports(workflow_outputs_dir, workflow_run_id: int) -> Dict[int, List[pathlib.Path]]:
+def _get_model_reports(workflow_outputs_dir, workflow_run_id: int) -> Dict[int, List[str]]:
     """
     This function searches for perf reports in the artifacts directory
     and returns a mapping of job IDs to the paths of the perf reports.
     We expect that report filename is in format `<report_name>_<job_id>.json`.
     """
-    job_paths_map = {}
+    job_paths_map = defaultdict(list)
     artifacts_dir = f"{workflow_outputs_dir}/{workflow_run_id}/artifacts"
 
     logger.info(f"Searching for perf reports in {artifacts_dir}")
 
-    for root, _, files in os.walk(artifacts_dir):
-        for file in files:
-            if file.endswith(".json"):
-                logger.debug(f"Found perf report {file}")
-                file_path = pathlib.Path(root) / file
-                filename = file_path.name
-                try:
-                    job_id = int(filename.split(".")[-2].split("_")[-1])
-                except ValueError:
-                    logger.warning(f"Could not extract job ID from {filename}")
-                    continue
-                report_paths = job_paths_map.get(job_id, [])
-                report_paths.append(file_path)
-                job_paths_map[job_id] = report_paths
-    return job_paths_map
+    for _, entry in walk_files(artifacts_dir):
+        filename = entry.name
+        # Hidden files such as macOS `._*` AppleDouble metadata are never reports
+        if filename.endswith(".json") and not filename.startswith("."):
+            logger.debug(f"Found perf report {filename}")
+            match = _REPORT_JOB_ID_RE.search(filename)
+            if match is None:
+                logger.warning(f"Could not extract job ID from {filename}")
+                continue
+            job_id = int(match.group(1))
+            job_paths_map[job_id].append(entry.path)
+    return dict(job_paths_map)
 
 
 class _BenchmarkDataMapper(ABC):
     @abstractmethod
-    def map_benchmark_data(self, pipeline, job_id, report_data) -> CompleteBenchmarkRun | None:
+    def map_benchmark_data(
+        self, pipeline, job_id, report_data, model_spec_data=None, jobs_by_id=None
+    ) -> CompleteBenchmarkRun | None:
         pass
 
-    def _get_job(self, pipeline, job_id):
+    def _get_job(self, pipeline, job_id, jobs_by_id=None):
         """
         Retrieves the job object from the pipeline using the job ID.
+        Uses the prebuilt jobs_by_id index when given, otherwise scans pipeline.jobs.
         """
-        job = next((job for job in pipeline.jobs if job.github_job_id == job_id), None)
+        if jobs_by_id is not None:
+            job = jobs_by_id.get(job_id)
+        else:
+            job = next((job for job in pipeline.jobs if job.github_job_id == job_id), None)
         if job is None:
             logger.error(f"No job found with github_job_id: {job_id}")
         return job
@@ -107,37 +142,45 @@ class _BenchmarkDataMapper(ABC):
     def _create_measurements(self, job, step_name, data, keys):
         """
         Creates BenchmarkMeasurement objects for the specified keys in the data.
+        Keys that are missing are skipped, keys set to None are skipped with a warning.
         """
-        measurements = []
-        for key in keys:
-            if key in data:
-                try:
-                    measurement = BenchmarkMeasurement(
-                        step_start_ts=job.job_start_ts,
-                        step_end_ts=job.job_end_ts,
-                        iteration=1,
-                        step_name=step_name,
-                        step_warm_up_num_iterations=None,
-                        name=key,
-                        value=data.get(key),
-                        target=None,
-                        device_power=None,
-                        device_temperature=None,
-                    )
-                    measurements.append(measurement)
-                except ValidationError as e:
-                    logger.error(
-                        f"Validation error while creating BenchmarkMeasurement for key '{key}' "
-                        f"with value {data.get(key)!r}: {e}",
-                        exc_info=True,
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Unexpected error while creating BenchmarkMeasurement for key '{key}' "
-                        f"with value {data.get(key)!r}: {e}",
-                        exc_info=True,
-                    )
-        return measurements
+        present = [(key, value) for key, value in zip(keys, map(data.get, keys)) if value is not None]
+        if len(present) < len(keys):
+            none_keys = [key for key in keys if key in data and data[key] is None]
+            if none_keys:
+                logger.warning(
+                    f"Skipping BenchmarkMeasurement keys with a None value for step '{step_name}': {none_keys}"
+                )
+        common = {
+            "step_start_ts": job.job_start_ts,
+            "step_end_ts": job.job_end_ts,
+            "iteration": 1,
+            "step_name": step_name,
+            "step_warm_up_num_iterations": None,
+            "target": None,
+            "device_power": None,
+            "device_temperature": None,
+        }
+        rows = [{**common, "name": key, "value": value} for key, value in present]
+        return validate_rows(_MEASUREMENTS_ADAPTER, BenchmarkMeasurement, rows, _report_measurement_error)
+
+    @staticmethod
+    def _pipeline_job_fields(pipeline, job):
+        """
+        Returns the CompleteBenchmarkRun fields that every mapper takes from the pipeline and job.
+        """
+        return {
+            "run_start_ts": pipeline.pipeline_start_ts,
+            "run_end_ts": pipeline.pipeline_end_ts,
+            "git_commit_hash": pipeline.git_commit_hash,
+            "git_commit_ts": pipeline.pipeline_submission_ts,
+            "git_branch_name": pipeline.git_branch_name,
+            "github_pipeline_id": pipeline.github_pipeline_id,
+            "github_pipeline_link": pipeline.github_pipeline_link,
+            "github_job_id": job.github_job_id,
+            "user_name": pipeline.git_author,
+            "device_hostname": job.host_name,
+        }
 
     def _create_complete_benchmark_run(
         self,
@@ -160,19 +203,10 @@ class _BenchmarkDataMapper(ABC):
         Creates a CompleteBenchmarkRun object with the provided data and measurements.
         """
         return CompleteBenchmarkRun(
-            run_start_ts=pipeline.pipeline_start_ts,
-            run_end_ts=pipeline.pipeline_end_ts,
+            **self._pipeline_job_fields(pipeline, job),
             run_type=run_type,
             git_repo_name=pipeline.project,
-            git_commit_hash=pipeline.git_commit_hash,
-            git_commit_ts=pipeline.pipeline_submission_ts,
-            git_branch_name=pipeline.git_branch_name,
-            github_pipeline_id=pipeline.github_pipeline_id,
-            github_pipeline_link=pipeline.github_pipeline_link,
-            github_job_id=job.github_job_id,
-            user_name=pipeline.git_author,
             docker_image=job.docker_image or docker_image,
-            device_hostname=job.host_name,
             device_ip=None,
             device_info=(
                 device_info if isinstance(device_info, dict) or device_info is None else {"device_name": device_info}
@@ -195,27 +229,40 @@ class _BenchmarkDataMapper(ABC):
 
 
 class ForgeBenchmarkDataMapper(_BenchmarkDataMapper):
-    def map_benchmark_data(self, pipeline, job_id, report_data, model_spec_data=None) -> CompleteBenchmarkRun | None:
-        job = next((job for job in pipeline.jobs if job.github_job_id == job_id), None)
+    @staticmethod
+    def _measurement_fields(job, measurement):
+        """
+        Returns BenchmarkMeasurement fields for a report measurement as a plain dict,
+        so pydantic-core validates the whole list in a single pass.
+        """
+        get = measurement.get
+        return {
+            "step_start_ts": job.job_start_ts,
+            "step_end_ts": job.job_end_ts,
+            "iteration": get("iteration"),
+            "step_name": get("step_name"),
+            "step_warm_up_num_iterations": get("step_warm_up_num_iterations"),
+            "name": get("measurement_name"),
+            "value": get("value"),
+            "target": get("target"),
+            "device_power": get("device_power"),
+            "device_temperature": get("device_temperature"),
+        }
+
+    def map_benchmark_data(
+        self, pipeline, job_id, report_data, model_spec_data=None, jobs_by_id=None
+    ) -> CompleteBenchmarkRun | None:
+        job = self._get_job(pipeline, job_id, jobs_by_id)
         if job is None:
-            logger.error(f"No job found with github_job_id: {job_id}")
             return None
 
+        measurement_fields = self._measurement_fields
         try:
             benchmark_run = CompleteBenchmarkRun(
-                run_start_ts=pipeline.pipeline_start_ts,
-                run_end_ts=pipeline.pipeline_end_ts,
+                **self._pipeline_job_fields(pipeline, job),
                 run_type=report_data.get("run_type"),
                 git_repo_name=report_data.get("project", pipeline.project),
-                git_commit_hash=pipeline.git_commit_hash,
-                git_commit_ts=pipeline.pipeline_submission_ts,
-                git_branch_name=pipeline.git_branch_name,
-                github_pipeline_id=pipeline.github_pipeline_id,
-                github_pipeline_link=pipeline.github_pipeline_link,
-                github_job_id=job.github_job_id,
-                user_name=pipeline.git_author,
                 docker_image=job.docker_image,
-                device_hostname=job.host_name,
                 device_ip=report_data.get("device_ip", None),
                 device_info=report_data.get("device_info"),
                 ml_model_name=report_data.get("model"),
@@ -232,19 +279,7 @@ class ForgeBenchmarkDataMapper(_BenchmarkDataMapper):
                 perf_analysis=report_data.get("perf_analysis"),
                 training=report_data.get("training", False),
                 measurements=[
-                    BenchmarkMeasurement(
-                        step_start_ts=job.job_start_ts,
-                        step_end_ts=job.job_end_ts,
-                        iteration=measurement.get("iteration"),
-                        step_name=measurement.get("step_name"),
-                        step_warm_up_num_iterations=measurement.get("step_warm_up_num_iterations"),
-                        name=measurement.get("measurement_name"),
-                        value=measurement.get("value"),
-                        target=measurement.get("target"),
-                        device_power=measurement.get("device_power"),
-                        device_temperature=measurement.get("device_temperature"),
-                    )
-                    for measurement in report_data.get("measurements", [])
+                    measurement_fields(job, measurement) for measurement in report_data.get("measurements", ())
                 ],
             )
             return [benchmark_run]
@@ -255,11 +290,13 @@ class ForgeBenchmarkDataMapper(_BenchmarkDataMapper):
 
 
 class ShieldBenchmarkDataMapper(_BenchmarkDataMapper):
-    def map_benchmark_data(self, pipeline, job_id, report_data, model_spec_data=None) -> CompleteBenchmarkRun | None:
+    def map_benchmark_data(
+        self, pipeline, job_id, report_data, model_spec_data=None, jobs_by_id=None
+    ) -> CompleteBenchmarkRun | None:
         """
         Maps benchmark and evaluation data from the report to CompleteBenchmarkRun objects.
         """
-        job = self._get_job(pipeline, job_id)
+        job = self._get_job(pipeline, job_id, jobs_by_id)
         if job is None:
             return None
 
@@ -641,9 +678,9 @@ class VllmBenchmarkDataMapper(_BenchmarkDataMapper):
     ]
 
     def map_benchmark_data(
-        self, pipeline, job_id, report_data, model_spec_data=None
+        self, pipeline, job_id, report_data, model_spec_data=None, jobs_by_id=None
     ) -> List[CompleteBenchmarkRun] | None:
-        job = self._get_job(pipeline, job_id)
+        job = self._get_job(pipeline, job_id, jobs_by_id)
         if job is None:
             return None
 
@@ -724,9 +761,9 @@ class GuideLLMBenchmarkDataMapper(_BenchmarkDataMapper):
         return copy
 
     def map_benchmark_data(
-        self, pipeline, job_id, report_data, model_spec_data=None
+        self, pipeline, job_id, report_data, model_spec_data=None, jobs_by_id=None
     ) -> List[CompleteBenchmarkRun] | None:
-        job = self._get_job(pipeline, job_id)
+        job = self._get_job(pipeline, job_id, jobs_by_id)
         if job is None:
             return None
 
@@ -832,34 +869,38 @@ class GuideLLMBenchmarkDataMapper(_BenchmarkDataMapper):
             return None
 
 
+# Mappers hold no state, so a single instance of each is shared across reports
+_FORGE_MAPPER = ForgeBenchmarkDataMapper()
+_SHIELD_MAPPER = ShieldBenchmarkDataMapper()
+_VLLM_MAPPER = VllmBenchmarkDataMapper()
+_GUIDELLM_MAPPER = GuideLLMBenchmarkDataMapper()
+
 _REPORT_TYPE_MAPPERS = {
-    ("tt-shield", "vllm_bench_serve"): VllmBenchmarkDataMapper,
-    ("tt-inference-server", "vllm_bench_serve"): VllmBenchmarkDataMapper,
-    ("tt-shield", "guidellm_benchmark"): GuideLLMBenchmarkDataMapper,
-    ("tt-inference-server", "guidellm_benchmark"): GuideLLMBenchmarkDataMapper,
+    ("tt-shield", "vllm_bench_serve"): _VLLM_MAPPER,
+    ("tt-inference-server", "vllm_bench_serve"): _VLLM_MAPPER,
+    ("tt-shield", "guidellm_benchmark"): _GUIDELLM_MAPPER,
+    ("tt-inference-server", "guidellm_benchmark"): _GUIDELLM_MAPPER,
 }
 
 
 _PROJECT_MAPPERS = {
-    "tt-forge-onnx": ForgeBenchmarkDataMapper,
-    "tt-xla": ForgeBenchmarkDataMapper,
-    "tt-forge": ForgeBenchmarkDataMapper,
-    "tt-mlir": ForgeBenchmarkDataMapper,
-    "tt-shield": ShieldBenchmarkDataMapper,
+    "tt-forge-onnx": _FORGE_MAPPER,
+    "tt-xla": _FORGE_MAPPER,
+    "tt-forge": _FORGE_MAPPER,
+    "tt-mlir": _FORGE_MAPPER,
+    "tt-shield": _SHIELD_MAPPER,
 }
 
 
 def _get_mapper(pipeline_project, report_data):
-    report_type = report_data.get("report_type")
-    mapper_cls = _REPORT_TYPE_MAPPERS.get((pipeline_project, report_type))
-    if mapper_cls:
-        return mapper_cls()
-    mapper_cls = _PROJECT_MAPPERS.get(pipeline_project)
-    if mapper_cls:
-        return mapper_cls()
-    raise ValueError(f"No mapper found for project {pipeline_project}!")
+    mapper = _REPORT_TYPE_MAPPERS.get((pipeline_project, report_data.get("report_type")))
+    if mapper is None:
+        mapper = _PROJECT_MAPPERS.get(pipeline_project)
+    if mapper is None:
+        raise ValueError(f"No mapper found for project {pipeline_project}!")
+    return mapper
 
 
-def _map_benchmark_data(pipeline, job_id, report_data, model_spec_data=None):
+def _map_benchmark_data(pipeline, job_id, report_data, model_spec_data=None, jobs_by_id=None):
     mapper = _get_mapper(pipeline.project, report_data)
-    return mapper.map_benchmark_data(pipeline, job_id, report_data, model_spec_data)
+    return mapper.map_benchmark_data(pipeline, job_id, report_data, model_spec_data, jobs_by_id)
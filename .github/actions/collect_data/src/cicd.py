@@ -2,27 +2,38 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import os
-import json
-import pathlib
+import re
 from loguru import logger
+from collections import defaultdict
 from datetime import timedelta
+from functools import partial
 import random
 from pydantic import ValidationError
 from shared import failure_happened
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Sequence
 
 from utils import (
     assert_workflow_completed,
     get_pipeline_row_from_github_info,
     get_job_rows_from_github_info,
     get_data_pipeline_datetime_from_datetime,
+    load_json_file,
+    parallel_map,
     parse_timestamp,
+    walk_files,
 )
 import pydantic_models
 from test_parser import parse_file
 
 
+# Handle both underscore-separated (report_12345.json)
+# and hyphen-separated (report-12345.json) job IDs
+_TEST_REPORT_JOB_ID_RE = re.compile(r"(?:^|[_-])(\d+)\.[^.]+\Z")
+
+# Directories that never hold test reports and are not descended into
+_NON_REPORT_DIRS = frozenset({"__pycache__", ".git", "node_modules"})
+
+
 def get_cicd_json_filename(pipeline):
     github_pipeline_start_ts = get_data_pipeline_datetime_from_datetime(pipeline.pipeline_start_ts)
     github_pipeline_id = pipeline.github_pipeline_id
@@ -39,14 +50,12 @@ def create_cicd_json_for_data_analysis(
     skip_log_download: bool = False,
 ):
     logger.info(f"Load pipeline info from: {github_pipeline_json_filename}")
-    with open(github_pipeline_json_filename) as github_pipeline_json_file:
-        github_pipeline_json = json.load(github_pipeline_json_file)
+    github_pipeline_json = load_json_file(github_pipeline_json_filename)
 
     assert_workflow_completed(github_pipeline_json)
 
     logger.info(f"Load jobs info from: {github_jobs_json_filename}")
-    with open(github_jobs_json_filename) as github_jobs_json_file:
-        github_jobs_json = json.load(github_jobs_json_file)
+    github_jobs_json = load_json_file(github_jobs_json_filename)
 
     raw_pipeline = get_pipeline_row_from_github_info(github_runner_environment, github_pipeline_json, github_jobs_json)
     raw_jobs = get_job_rows_from_github_info(
@@ -63,21 +72,26 @@ def create_cicd_json_for_data_analysis(
     git_branch = raw_pipeline.get("git_branch_name", "")
     logger.info(f"Processing pipeline on branch: {git_branch}")
 
+    # Test reports are independent of each other and CPU-bound to parse, so all
+    # of them are parsed up front across worker processes and regrouped per job.
+    report_tasks = [
+        (github_job_id, test_report_path)
+        for github_job_id in dict.fromkeys(raw_job["github_job_id"] for raw_job in raw_jobs)
+        for test_report_path in github_job_id_to_test_reports.get(github_job_id, [])
+    ]
+    parsed_reports = parallel_map(partial(_parse_test_report, project), report_tasks)
+    github_job_id_to_tests = {}
+    for (github_job_id, test_report_path), tests_in_report in zip(report_tasks, parsed_reports):
+        logger.info(f"Found {len(tests_in_report)} tests in report {test_report_path}")
+        github_job_id_to_tests.setdefault(github_job_id, []).extend(tests_in_report)
+
     for raw_job in raw_jobs:
         tests = []
         github_job_id = raw_job["github_job_id"]
         job_name = raw_job.get("name", "")
         logger.info(f"Processing raw GitHub job {github_job_id} with name '{job_name}'")
         if github_job_id in github_job_id_to_test_reports:
-            for test_report_path in github_job_id_to_test_reports[github_job_id]:
-                logger.info(f"Processing test report {test_report_path}")
-                tests_in_report = parse_file(
-                    test_report_path,
-                    project=project,
-                    github_job_id=github_job_id,
-                )
-                logger.info(f"Found {len(tests_in_report)} tests in report {test_report_path}")
-                tests.extend(tests_in_report)
+            tests = github_job_id_to_tests.get(github_job_id, [])
             logger.info(f"Found {len(tests)} tests total for job {github_job_id}")
         raw_job["job_start_ts"] = alter_time(raw_job["job_start_ts"])
         try:
@@ -91,8 +105,14 @@ def create_cicd_json_for_data_analysis(
     return pydantic_models.Pipeline(**raw_pipeline, jobs=jobs)
 
 
+def _parse_test_report(project, report_task):
+    github_job_id, test_report_path = report_task
+    logger.info(f"Processing test report {test_report_path}")
+    return parse_file(test_report_path, project=project, github_job_id=github_job_id)
+
+
 def get_github_job_id_to_test_reports(
-    workflow_outputs_dir, workflow_run_id: int, extensions: Union[List[str], str] = [".xml", ".json"]
+    workflow_outputs_dir, workflow_run_id: int, extensions: Union[Sequence[str], str] = (".xml", ".json")
 ) -> Dict[int, List[str]]:
     """
     This function searches for test reports in the artifacts directory
@@ -100,41 +120,37 @@ def get_github_job_id_to_test_reports(
     We expect that report filename is in format `<report_name>_<job_id>.xml/json`.
     """
 
-    if not isinstance(extensions, list):
-        extensions = [extensions]
+    # str.endswith takes a tuple and checks all extensions in a single call
+    extensions = (extensions,) if isinstance(extensions, str) else tuple(extensions)
 
-    job_paths_map = {}
+    job_paths_map = defaultdict(list)
     artifacts_dir = f"{workflow_outputs_dir}/{workflow_run_id}/artifacts"
 
     logger.info(f"Searching for test reports in {artifacts_dir}")
 
-    for root, _, files in os.walk(artifacts_dir):
-        for file in files:
-            file_extension = os.path.splitext(file)[1]
-            if file_extension in extensions:
-                # Skip performance/benchmark reports - they're handled by benchmark.py
-                if file.startswith("report_perf_") or "perf-reports" in root:
-                    continue
-
-                logger.debug(f"Found test report {file}")
-                file_path = pathlib.Path(root) / file
-                filename = file_path.name
-                try:
-                    stem = pathlib.Path(filename).stem
-                    # Handle both underscore-separated (report_12345.json)
-                    # and hyphen-separated (report-12345.json) job IDs
-                    last_part = stem.split("_")[-1]
-                    job_id = int(last_part.split("-")[-1])
-                except ValueError:
-                    logger.warning(f"Could not extract job ID from {filename}")
-                    continue
-                report_paths = job_paths_map.get(job_id, [])
-                report_paths.append(file_path)
-                job_paths_map[job_id] = report_paths
+    for root, entry in walk_files(artifacts_dir, skip_dir=_is_non_report_dir):
+        file = entry.name
+        if file.endswith(extensions):
+            # Skip performance/benchmark reports - they're handled by benchmark.py
+            if file.startswith("report_perf_") or "perf-reports" in root:
+                continue
+
+            logger.debug(f"Found test report {file}")
+            match = _TEST_REPORT_JOB_ID_RE.search(file)
+            if match is None:
+                logger.warning(f"Could not extract job ID from {file}")
+                continue
+            job_id = int(match.group(1))
+            job_paths_map[job_id].append(entry.path)
 
     if len(job_paths_map) == 0:
         logger.info(f"No test reports with the extension in {extensions} found in {artifacts_dir}")
-    return job_paths_map
+    return dict(job_paths_map)
+
+
+def _is_non_report_dir(entry) -> bool:
+    # Performance/benchmark reports are handled by benchmark.py
+    return entry.name in _NON_REPORT_DIRS or "perf-reports" in entry.name
 
 
 def alter_time(timestamp):
@@ -8,9 +8,16 @@ import argparse
 from loguru import logger
 from utils import get_github_runner_environment
 from cicd import create_cicd_json_for_data_analysis, get_cicd_json_filename
-from benchmark import create_json_from_report, get_benchmark_filename
+from benchmark import get_benchmark_filename, iter_benchmark_runs
 from optests import create_optest_reports, get_optest_filename
 from shared import is_failure
+from pydantic import TypeAdapter
+from pydantic_models import OpTest, Pipeline
+from typing import List
+
+# Serialize straight to UTF-8 bytes in one pydantic-core call
+_PIPELINE_ADAPTER = TypeAdapter(Pipeline)
+_OPTESTS_ADAPTER = TypeAdapter(List[OpTest])
 
 
 def create_pipeline_json(
@@ -34,22 +41,24 @@ def create_pipeline_json(
     report_filename = get_cicd_json_filename(pipeline)
     logger.info(f"Writing pipeline JSON to {report_filename}")
 
-    with open(report_filename, "w") as f:
-        f.write(pipeline.model_dump_json())
+    with open(report_filename, "wb") as f:
+        f.write(_PIPELINE_ADAPTER.dump_json(pipeline))
 
     return pipeline, report_filename
 
 
 def create_benchmark_jsonl(pipeline, workflow_outputs_dir) -> str:
-    reports = create_json_from_report(pipeline, workflow_outputs_dir)
-    if not reports:
+    # Runs arrive sorted by github_job_id descending (run_start_ts is the pipeline start for all
+    # of them), so they are streamed to the file as they are mapped instead of being collected first.
+    reports = iter_benchmark_runs(pipeline, workflow_outputs_dir)
+    first_report = next(reports, None)
+    if first_report is None:
         logger.warning("No benchmark reports found")
         return None
-    # Sort reports by github_job_id and run_start_ts descending
-    reports.sort(key=lambda x: (x.github_job_id, x.run_start_ts), reverse=True)
-    report_filename = get_benchmark_filename(reports[0])
+    report_filename = get_benchmark_filename(first_report)
     logger.info(f"Writing all benchmark JSONs to {report_filename}")
     with open(report_filename, "w") as f:
+        f.write(first_report.model_dump_json() + "\n")
         for report in reports:
             f.write(report.model_dump_json() + "\n")
     return report_filename
@@ -63,13 +72,8 @@ def create_optest_json(pipeline, workflow_outputs_dir):
             continue
         report_filename = get_optest_filename(pipeline, job_id)
         logger.info(f"Writing OpTest JSON to {report_filename}")
-        with open(report_filename, "w") as f:
-            f.write("[")
-            for i, optest in enumerate(optests):
-                if i > 0:
-                    f.write(",")
-                f.write(optest.model_dump_json())
-            f.write("]")
+        with open(report_filename, "wb") as f:
+            f.write(_OPTESTS_ADAPTER.dump_json(optests))
     return reports
 
 
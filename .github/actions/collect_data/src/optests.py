@@ -2,15 +2,22 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+from functools import partial
 from loguru import logger
 from cicd import get_github_job_id_to_test_reports
-from utils import get_data_pipeline_datetime_from_datetime
+from utils import get_data_pipeline_datetime_from_datetime, parallel_map
 import json
 from parsers.tt_torch_model_tests_parser import TTTorchModelTestsParser
 from parsers.builder_pytest_parser import BuilderPytestParser
 from parsers.tt_xla_op_by_op_parser import TTXlaOpByOpParser
 from typing import Optional
 
+# Parsers hold no state, so one instance of each serves every report
+_builder_pytest_parser = BuilderPytestParser()
+_tt_torch_model_tests_parser = TTTorchModelTestsParser()
+_tt_xla_op_by_op_parser = TTXlaOpByOpParser()
+
 
 def should_use_builder_pytest_parser(test_report: str, job_name: Optional[str], git_branch: Optional[str]) -> bool:
     """
@@ -22,21 +29,35 @@ def should_use_builder_pytest_parser(test_report: str, job_name: Optional[str],
     :return: True if BuilderPytestParser should be used, False otherwise.
     """
 
-    file_name = str(test_report).lower()
+    if not job_name or not git_branch:
+        return False
+
+    return _should_use_builder_pytest_parser(
+        str(test_report).lower(), job_name, "builder" in job_name.lower(), git_branch
+    )
+
+
+def _should_use_builder_pytest_parser(
+    file_name: str, job_name: str, is_builder_job_name: bool, git_branch: str
+) -> bool:
+    """
+    Report-level part of `should_use_builder_pytest_parser`.
+
+    :param file_name: Lowercased filename of the test report.
+    :param is_builder_job_name: Whether the job name contains 'builder', computed once per job.
+    """
     if not file_name.endswith(".xml"):
         return False
 
-    if not job_name or not git_branch:
+    if not (is_builder_job_name or "_builder" in file_name):
         return False
 
-    is_builder_job = "builder" in job_name.lower() or "_builder" in file_name
     # Use BuilderPytestParser only for jobs with "builder" in the name on main branch
-    if is_builder_job and git_branch == "main":
+    if git_branch == "main":
         logger.info(f"Should use BuilderPytestParser for builder job '{job_name}' on main branch")
         return True
-    elif is_builder_job and git_branch != "main":
-        logger.info(f"Skipping BuilderPytestParser for builder job '{job_name}' on branch '{git_branch}' (not main)")
 
+    logger.info(f"Skipping BuilderPytestParser for builder job '{job_name}' on branch '{git_branch}' (not main)")
     return False
 
 
@@ -59,8 +80,6 @@ def should_use_tt_xla_op_by_op_parser(test_report: str) -> bool:
 
 
 def create_optest_reports(pipeline, workflow_outputs_dir):
-    reports = []
-
     # Create a mapping from job_id to job_name
     job_id_to_name = {j.github_job_id: j.name for j in pipeline.jobs}
 
@@ -69,39 +88,55 @@ def create_optest_reports(pipeline, workflow_outputs_dir):
 
     # Search for reports with `.tar`, `.xml` & `.json` extensions.
     github_job_id_to_test_reports = get_github_job_id_to_test_reports(
-        workflow_outputs_dir, pipeline.github_pipeline_id, [".tar", ".xml", ".json"]
+        workflow_outputs_dir, pipeline.github_pipeline_id, (".tar", ".xml", ".json")
     )
 
     if len(github_job_id_to_test_reports) == 0:
         logger.info(f"No test reports to parse, skipping...")
         return []
 
+    # Select a parser for every report up front, then parse the reports across processes
+    report_tasks = []
     for github_job_id, test_reports in github_job_id_to_test_reports.items():
-        tests = []
         job_name = str(job_id_to_name.get(github_job_id, ""))
+        # Builder parsing needs both a job name and a branch; the job name check is the same for every report
+        check_builder = bool(job_name and git_branch)
+        is_builder_job_name = "builder" in job_name.lower()
 
         for test_report in test_reports:
+            test_report = os.fspath(test_report)
 
             # Select parser based on report name, job name and git branch
-            if should_use_builder_pytest_parser(test_report, job_name, git_branch):
-                parser = BuilderPytestParser()
+            if check_builder and _should_use_builder_pytest_parser(
+                test_report.lower(), job_name, is_builder_job_name, git_branch
+            ):
+                parser = _builder_pytest_parser
                 logger.info(f"Using BuilderPytestParser for job '{job_name}' on branch '{git_branch}'")
             elif should_use_tt_torch_model_tests_parser(test_report):
-                parser = TTTorchModelTestsParser()
+                parser = _tt_torch_model_tests_parser
                 logger.info(f"Using TTTorchModelTestsParser for job '{job_name}'")
             elif should_use_tt_xla_op_by_op_parser(test_report):
-                parser = TTXlaOpByOpParser()
+                parser = _tt_xla_op_by_op_parser
                 logger.info(f"Using TTXlaOpByOpParser for job '{job_name}'")
             else:
                 logger.info(f"No suitable parser found for {test_report}")
                 continue
-            try:
-                parsed_tests = parser.parse(test_report, project=pipeline.project, github_job_id=github_job_id)
-                tests.extend(parsed_tests)
-            except Exception as e:
-                logger.error(f"Failed to parse {test_report} with {type(parser)}: {e}")
-        reports.append((github_job_id, tests))
-    return reports
+            report_tasks.append((github_job_id, test_report, parser))
+
+    parsed_reports = parallel_map(partial(_parse_optest_report, pipeline.project), report_tasks)
+    github_job_id_to_tests = {github_job_id: [] for github_job_id in github_job_id_to_test_reports}
+    for (github_job_id, _, _), parsed_tests in zip(report_tasks, parsed_reports):
+        github_job_id_to_tests[github_job_id].extend(parsed_tests)
+    return list(github_job_id_to_tests.items())
+
+
+def _parse_optest_report(project, report_task):
+    github_job_id, test_report, parser = report_task
+    try:
+        return parser.parse(test_report, project=project, github_job_id=github_job_id)
+    except Exception as e:
+        logger.error(f"Failed to parse {test_report} with {type(parser)}: {e}")
+        return []
 
 
 def get_optest_filename(pipeline, job_id):
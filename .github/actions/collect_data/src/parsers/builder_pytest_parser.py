@@ -3,16 +3,14 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from loguru import logger
-from functools import partial
 from pydantic_models import OpTest, TensorDesc, TestStatus
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 from .parser import Parser
 from . import junit_xml_utils
 from utils import parse_timestamp
-import ast
-from pydantic import ValidationError
-from shared import failure_happened, is_valid_testcase_
+from pydantic import TypeAdapter
+from shared import is_valid_testcase_, validate_rows
 
 FAILURE_STAGE_TO_STATUS_ENUM: dict[str, TestStatus] = {
     "compile": TestStatus.compile_failed,
@@ -20,6 +18,13 @@ FAILURE_STAGE_TO_STATUS_ENUM: dict[str, TestStatus] = {
     "runtime": TestStatus.run_failed,
     "success": TestStatus.success,
 }
+_UNKNOWN_FAILURE_STAGE = object()
+_OPTESTS_ADAPTER = TypeAdapter(List[OpTest])
+# Shared duration for testcases that report time="0", e.g. skips
+_ZERO_DURATION = timedelta(0)
+
+# ElementPath selector for testsuite-level properties
+_SUITE_PROPERTY_PATH = "properties/property"
 
 
 class BuilderPytestParser(Parser):
@@ -29,20 +34,8 @@ class BuilderPytestParser(Parser):
         if not filepath.endswith(".xml"):
             return False
         try:
-            report_root_tree = junit_xml_utils.get_xml_file_root_element_tree(filepath)
-            report_root = report_root_tree.getroot()
-            is_pytest = junit_xml_utils.is_pytest_junit_xml(report_root)
-
-            # Additional check for builder specific tests
-            if is_pytest:
-                testsuite = report_root[0]
-                # Look for card type property which indicates builder tests
-                properties = testsuite.find("properties")
-                if properties is not None:
-                    for prop in properties.findall("property"):
-                        if prop.get("name") == "card":
-                            return True
-            return False
+            # Look for card type property which indicates builder tests
+            return junit_xml_utils.pytest_testsuite_has_property(filepath, "card")
         except Exception:
             return False
 
@@ -56,116 +49,97 @@ class BuilderPytestParser(Parser):
 
 
 def get_tests(filepath, project: Optional[str] = None, github_job_id: Optional[int] = None):
-    report_root_tree = junit_xml_utils.get_xml_file_root_element_tree(filepath)
-    report_root = report_root_tree.getroot()
-    testsuite = report_root[0]
+    suite_fields = None
+    rows = []
+    for testsuite, testcase in junit_xml_utils.iter_pytest_testcases(filepath):
+        if suite_fields is None:
+            # Suite attributes and properties precede the testcases, so they
+            # are available once the first testcase has been streamed
+            suite_fields = _get_suite_fields(testsuite)
+            default_timestamp, card_type, git_sha = suite_fields
+        if is_valid_testcase_(testcase):
+            rows.append(
+                get_optest_fields_from_pytest_testcase_(
+                    testcase, card_type, git_sha, github_job_id, default_timestamp, project
+                )
+            )
+
+    return validate_rows(_OPTESTS_ADAPTER, OpTest, rows)
+
+
+def _get_suite_fields(testsuite):
     default_timestamp = parse_timestamp(testsuite.attrib["timestamp"])
 
     # Extract card type and git SHA from testsuite properties
-    card_type = _get_card_type(testsuite)
-    git_sha = _get_git_sha(testsuite)
-
-    get_pydantic_test = partial(
-        get_pydantic_optest_from_pytest_testcase_,
-        default_timestamp=default_timestamp,
-        project=project,
-        github_job_id=github_job_id,
-        card_type=card_type,
-        git_sha=git_sha,
-    )
-    tests = []
-    for testcase in testsuite:
-        if is_valid_testcase_(testcase):
-            test = get_pydantic_test(testcase)
-            if test:
-                tests.append(test)
-    return tests
-
-
-def _get_card_type(testsuite) -> str:
-    """Extract card type from testsuite properties."""
-    properties = testsuite.find("properties")
-    try:
-        for prop in properties.findall("property"):
-            if prop.get("name") == "card":
-                return prop.get("value")
-        raise KeyError
-    except Exception:
-        raise KeyError("Unable to find 'card' property in suite")
-
-
-def _get_git_sha(testsuite) -> str:
-    """Extract git SHA from testsuite properties."""
-    properties = testsuite.find("properties")
-    try:
-        for prop in properties.findall("property"):
-            if prop.get("name") == "git_sha":
-                return prop.get("value")
-        raise KeyError
-    except Exception:
-        raise KeyError("Unable to find 'git_sha' property in suite")
-
-
-def get_pydantic_optest_from_pytest_testcase_(
+    suite_properties = _get_suite_properties(testsuite)
+    missing = [name for name in ("card", "git_sha") if name not in suite_properties]
+    if missing:
+        raise KeyError(f"Unable to find {', '.join(repr(name) for name in missing)} property in suite")
+
+    return default_timestamp, suite_properties["card"], suite_properties["git_sha"]
+
+
+def _get_suite_properties(testsuite) -> dict:
+    """Collect testsuite properties in one scan, keeping the first value of each name."""
+    suite_properties = {}
+    for prop in testsuite.iterfind(_SUITE_PROPERTY_PATH):
+        suite_properties.setdefault(prop.get("name"), prop.get("value"))
+    return suite_properties
+
+
+def get_optest_fields_from_pytest_testcase_(
     testcase,
     card_type: str,
     git_sha: str,
     github_job_id: Optional[int] = None,
-    default_timestamp: Optional[datetime] = datetime.now(),
+    default_timestamp: Optional[datetime] = None,
     project: Optional[str] = None,
 ):
-    skipped = junit_xml_utils.get_pytest_testcase_is_skipped(testcase)
-    failed = junit_xml_utils.get_pytest_testcase_is_failed(testcase)
-    error = junit_xml_utils.get_pytest_testcase_is_error(testcase)
+    properties, skipped_element, failure_element, error_element = junit_xml_utils.scan_pytest_testcase(testcase)
+    skipped = skipped_element is not None
+    failed = failure_element is not None
+    error = error_element is not None
     success = not (failed or error)
 
-    error_message = None
-
     # First try to get error message from XML properties if it exists
-    properties = {}
-    try:
-        properties = junit_xml_utils.get_pytest_testcase_properties(testcase)
-        error_message = properties.get("error_message")
-    except:
-        pass
+    properties = properties or {}
+    error_message = properties.get("error_message")
 
     # Fallback to junit XML error/failure messages if no error_message property
     if error_message is None:
         # Error is scarier than failure, expose that first
         if failed:
-            error_message = junit_xml_utils.get_pytest_failure_message(testcase)
+            error_message = failure_element.attrib["message"]
 
         if error:
-            error_message = junit_xml_utils.get_pytest_error_message(testcase)
+            error_message = error_element.attrib["message"]
 
         if skipped:
-            error_message = junit_xml_utils.get_pytest_skipped_message(testcase)
+            error_message = f"[{skipped_element.attrib['type']}] {skipped_element.attrib['message']}"
 
     test_duration_seconds = float(testcase.attrib["time"])
-    test_duration = timedelta(seconds=test_duration_seconds)
+    test_duration = _ZERO_DURATION if test_duration_seconds == 0.0 else timedelta(seconds=test_duration_seconds)
 
     # Error at the beginning of a test can prevent pytest from recording timestamps at all
     if not (skipped or error) and "start_timestamp" in properties:
         test_start_ts = parse_timestamp(properties["start_timestamp"])
-    else:
+    elif default_timestamp is not None:
         test_start_ts = default_timestamp
+    else:
+        test_start_ts = datetime.now()
 
     test_end_ts = None
 
     test_name = testcase.attrib["name"]
-    test_case_name = test_name.split("[")[0]
+    test_case_name = test_name.partition("[")[0]
 
-    filepath_no_ext = testcase.attrib["classname"].replace(".", "/")
-    filepath = f"{filepath_no_ext}.py"
+    filepath = junit_xml_utils.classname_to_filepath(testcase.attrib["classname"])
 
     full_test_name = f"{filepath}::{test_name}"
 
     # Extract test parameters from prefixed properties (param_*)
-    config = {}
-    for key, value in properties.items():
-        if key.startswith("param_"):
-            param_name = key[6:]  # Remove "param_" prefix
-            config[param_name] = value
+    # Strip the "param_" prefix from the key
+    config = {key[6:]: value for key, value in properties.items() if key.startswith("param_")}
 
     # Determine backend from XML properties
     backend_str = properties.get("backend")
@@ -176,10 +150,9 @@ def get_pydantic_optest_from_pytest_testcase_(
     failure_stage = properties.get("failure_stage")
 
     if failure_stage is not None:
-        try:
-            status = FAILURE_STAGE_TO_STATUS_ENUM[failure_stage]
-        except KeyError:
-            raise ValueError("Invalid status string: {failure_stage}")
+        status = FAILURE_STAGE_TO_STATUS_ENUM.get(failure_stage, _UNKNOWN_FAILURE_STAGE)
+        if status is _UNKNOWN_FAILURE_STAGE:
+            raise ValueError(f"Invalid status string: {failure_stage}")
     else:  # TODO: think about how to handle tests with null failure_stage
         # No failure_stage property means test was skipped before execution
         if skipped:
@@ -211,14 +184,14 @@ def get_pydantic_optest_from_pytest_testcase_(
 
         try:
             # Parse shapes and dtypes from XML properties
-            shapes_list = ast.literal_eval(input_shapes_str)
-            dtypes_list = ast.literal_eval(input_dtypes_str)
+            shapes_list = junit_xml_utils.parse_literal_property(input_shapes_str)
+            dtypes_list = junit_xml_utils.parse_literal_property(input_dtypes_str)
 
             for (shape, dtype) in zip(shapes_list, dtypes_list):
                 if not isinstance(shape, (list, tuple)):
                     shape = [shape]  # Handle single dimension
 
-                tensor_desc = TensorDesc(
+                tensor_desc = TensorDesc.from_values(
                     shape=list(shape),
                     data_type=dtype,
                     buffer_type="DRAM",  # default
@@ -233,33 +206,29 @@ def get_pydantic_optest_from_pytest_testcase_(
         inputs = None
         outputs = None
 
-    try:
-        return OpTest(
-            github_job_id=github_job_id or 0,
-            full_test_name=full_test_name,
-            test_start_ts=test_start_ts,
-            test_end_ts=test_end_ts,
-            test_duration=test_duration,
-            test_case_name=test_case_name,
-            filepath=filepath,
-            success=success,
-            skipped=skipped,
-            message=error_message,
-            config=config,
-            frontend=properties.get("frontend", project or "builder"),
-            model_name="builder_ops",  # Default model name for builder tests
-            op_kind=op_kind,
-            op_name=op_name,
-            framework_op_name=framework_op_name,
-            inputs=inputs,
-            outputs=outputs,
-            op_params=config,
-            git_sha=git_sha,
-            status=status,
-            card_type=card_type,
-            backend=backend_str,
-        )
-    except ValidationError as e:
-        failure_happened()
-        logger.error(f"Validation error: {e}")
-        return None
+    return dict(
+        github_job_id=github_job_id or 0,
+        full_test_name=full_test_name,
+        test_start_ts=test_start_ts,
+        test_end_ts=test_end_ts,
+        test_duration=test_duration,
+        test_case_name=test_case_name,
+        filepath=filepath,
+        success=success,
+        skipped=skipped,
+        message=error_message,
+        config=config,
+        frontend=properties.get("frontend", project or "builder"),
+        model_name="builder_ops",  # Default model name for builder tests
+        op_kind=op_kind,
+        op_name=op_name,
+        framework_op_name=framework_op_name,
+        inputs=inputs,
+        outputs=outputs,
+        op_params=config,
+        git_sha=git_sha,
+        status=status,
+        card_type=card_type,
+        backend=backend_str,
+    )
+
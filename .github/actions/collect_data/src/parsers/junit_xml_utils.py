@@ -2,104 +2,154 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from functools import reduce
-
-from loguru import logger
-from defusedxml.ElementTree import parse as XMLParse
-from toolz.dicttoolz import merge
-
-
-def get_xml_file_root_element_tree(filepath):
-    root_element_tree = XMLParse(filepath)
-    root_element = root_element_tree.getroot()
-
-    assert root_element.tag == "testsuites"
-
-    return root_element_tree
-
-
-def sanity_check_pytest_junit_xml_(root_element):
-    testsuite_count = len(root_element)
-
-    assert testsuite_count == 1, f"{len(root_element)}"
-
-    logger.debug("Asserted pytest junit xml")
-
-    return root_element
-
-
-def is_pytest_junit_xml(root_element):
-    is_pytest = root_element[0].get("name") == "pytest"
-
-    if is_pytest:
-        sanity_check_pytest_junit_xml_(root_element)
-
-    return is_pytest
-
-
-def get_at_most_one_single_child_element_(element, tag_name):
-    is_expected = lambda child_: child_.tag == tag_name
-
-    potential_expected_blocks = list(filter(is_expected, element))
-
-    assert (
-        len(potential_expected_blocks) <= 1
-    ), f"{len(potential_expected_blocks)} is not exactly 1 for tag name {tag_name}"
-
-    return potential_expected_blocks[0] if len(potential_expected_blocks) else None
-
-
-def get_pytest_testcase_properties(testcase_element):
-    properties_block = get_at_most_one_single_child_element_(testcase_element, "properties")
-
-    assert properties_block is not None
-
-    def get_property_as_dict_(property_):
-        assert property_.tag == "property"
-
-        return dict([(property_.attrib["name"], property_.attrib["value"])])
-
-    return reduce(merge, map(get_property_as_dict_, properties_block), {})
-
-
-def get_optional_child_element_exists_(parent_element, tag_name):
-    return get_at_most_one_single_child_element_(parent_element, tag_name) != None
-
-
-def get_pytest_testcase_is_skipped(testcase_element):
-    return get_optional_child_element_exists_(testcase_element, "skipped")
-
-
-def get_pytest_testcase_is_failed(testcase_element):
-    return get_optional_child_element_exists_(testcase_element, "failure")
-
-
-def get_pytest_testcase_is_error(testcase_element):
-    return get_optional_child_element_exists_(testcase_element, "error")
-
-
-# opportunity for less copy-pasta
-
-
-def get_pytest_failure_message(testcase_element):
-    assert get_pytest_testcase_is_failed(testcase_element)
-
-    failure_element = get_at_most_one_single_child_element_(testcase_element, "failure")
-
-    return failure_element.attrib["message"]
-
-
-def get_pytest_error_message(testcase_element):
-    assert get_pytest_testcase_is_error(testcase_element)
-
-    error_element = get_at_most_one_single_child_element_(testcase_element, "error")
-
-    return error_element.attrib["message"]
-
-
-def get_pytest_skipped_message(testcase_element):
-    assert get_pytest_testcase_is_skipped(testcase_element)
-    skipped_element = get_at_most_one_single_child_element_(testcase_element, "skipped")
-    message = skipped_element.attrib["message"]
-    type = skipped_element.attrib["type"]
-    return f"[{type}] {message}"
+import ast
+from functools import lru_cache
+
+import orjson
+from defusedxml.ElementTree import iterparse as XMLIterParse
+
+
+@lru_cache(maxsize=1024)
+def classname_to_filepath(classname):
+    """Map a pytest classname (dotted module path) to its test file path."""
+    filepath_no_ext = classname.replace(".", "/")
+    return f"{filepath_no_ext}.py"
+
+
+@lru_cache(maxsize=1024)
+def parse_literal_property(value):
+    """
+    Parse a property value written either as JSON, which goes through orjson, or
+    as a Python literal (e.g. single-quoted strings), which falls back to
+    ast.literal_eval. Reports repeat a handful of distinct values, so results are
+    cached; callers must not mutate them.
+    """
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return ast.literal_eval(value)
+
+
+def iter_pytest_testcases(filepath):
+    """
+    Stream (testsuite, testcase) pairs for the first testsuite of a JUnit XML
+    report without building the whole document tree.
+
+    The testsuite element carries its attributes and any children parsed so far,
+    such as the suite <properties> that precede the testcases. Each testcase is
+    detached from the testsuite once the caller is done with it, so only one
+    testcase is resident at a time.
+    """
+    depth = 0
+    testsuite = None
+    in_first_testsuite = False
+
+    for event, element in XMLIterParse(filepath, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                assert element.tag == "testsuites"
+            elif depth == 2:
+                if testsuite is None:
+                    testsuite = element
+                in_first_testsuite = element is testsuite
+            continue
+
+        depth -= 1
+        if depth == 1 and element is testsuite:
+            return
+        if depth == 2 and in_first_testsuite and element.tag == "testcase":
+            yield testsuite, element
+            testsuite.remove(element)
+
+
+def pytest_testsuite_has_property(filepath, property_name):
+    """
+    Check whether a pytest JUnit XML report with exactly one testsuite declares a
+    suite-level property.
+
+    Returns False as soon as the testcases start without the property having been
+    seen. Once it has been seen, the rest of the report is still scanned so that a
+    second testsuite rejects the report, but testcases are dropped as they end.
+    """
+    depth = 0
+    testsuite = None
+    suite_child_tag = None
+    found = False
+
+    for event, element in XMLIterParse(filepath, events=("start", "end")):
+        if event == "end":
+            depth -= 1
+            if depth == 2:
+                testsuite.remove(element)
+            continue
+
+        depth += 1
+        if depth == 1:
+            assert element.tag == "testsuites"
+        elif depth == 2:
+            # The report must hold a single testsuite, and it must come from pytest
+            if testsuite is not None or element.get("name") != "pytest":
+                return False
+            testsuite = element
+        elif depth == 3:
+            # Suite properties precede the testcases
+            if not found and element.tag == "testcase":
+                return False
+            suite_child_tag = element.tag
+        elif depth == 4 and suite_child_tag == "properties" and element.tag == "property":
+            if element.get("name") == property_name:
+                found = True
+
+    return found
+
+
+def is_pytest_junit_xml_file(filepath):
+    """
+    Check whether a JUnit XML report comes from pytest by looking at the name of
+    its first testsuite, without parsing past that testsuite's start tag.
+    """
+    depth = 0
+    for event, element in XMLIterParse(filepath, events=("start", "end")):
+        if event == "end":
+            depth -= 1
+            continue
+
+        depth += 1
+        if depth == 1:
+            assert element.tag == "testsuites"
+        elif depth == 2:
+            return element.get("name") == "pytest"
+
+    return False
+
+
+def scan_pytest_testcase(testcase_element):
+    """
+    Classify the children of a pytest testcase in a single pass.
+
+    Returns (properties, skipped, failure, error): the testcase properties as a
+    dict, or None when there is no single well-formed <properties> block, and the
+    <skipped>, <failure> and <error> child elements, or None when absent.
+    """
+    children = {"properties": [], "skipped": [], "failure": [], "error": []}
+    for child in testcase_element:
+        same_tag_children = children.get(child.tag)
+        if same_tag_children is not None:
+            same_tag_children.append(child)
+
+    def get_at_most_one_(tag_name):
+        tag_children = children[tag_name]
+        assert len(tag_children) <= 1, f"{len(tag_children)} is not exactly 1 for tag name {tag_name}"
+        return tag_children[0] if tag_children else None
+
+    properties = None
+    if len(children["properties"]) == 1:
+        properties = {}
+        for property_ in children["properties"][0]:
+            if property_.tag != "property" or "name" not in property_.attrib or "value" not in property_.attrib:
+                properties = None
+                break
+            properties[property_.attrib["name"]] = property_.attrib["value"]
+
+    return properties, get_at_most_one_("skipped"), get_at_most_one_("failure"), get_at_most_one_("error")
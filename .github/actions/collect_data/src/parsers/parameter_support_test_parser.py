@@ -2,18 +2,56 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import mmap
+import os
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from loguru import logger
 from pydantic_models import Test
 from typing import Optional, List, ClassVar
 from .parser import Parser
 from pydantic import ValidationError
 from shared import failure_happened
+from utils import load_json_file
 import json
 
 
 CATEGORY = "parameter_support"
 OWNER = "tt-shield"
+_PARAMETER_SUPPORT_TESTS_KEY = b'"parameter_support_tests"'
+
+# Lowercased status strings reported by the parameter support test suites, mapped to (success, failed, skipped)
+_STATUS_FLAGS = {
+    **dict.fromkeys(("passed", "success", "pass", "ok"), (True, False, False)),
+    **dict.fromkeys(("failed", "failure", "fail", "error"), (False, True, False)),
+    **dict.fromkeys(("skipped", "skip"), (False, False, True)),
+}
+_UNKNOWN_STATUS_FLAGS = (False, False, False)
+
+
+def _load_report(filepath: str):
+    """
+    Load a report, reusing the document decoded by can_parse when parse is
+    called on the same unchanged file. The result is shared, so it must not be
+    modified.
+    """
+    stat = os.stat(filepath)
+    return _load_report_cached(filepath, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def _load_report_cached(filepath: str, mtime_ns: int, size: int):
+    return load_json_file(filepath)
+
+
+def _file_contains(filepath: str, needle: bytes) -> bool:
+    """Search a file for a byte string through a read-only memory map, without decoding it."""
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
 
 
 @dataclass(frozen=True)
@@ -44,10 +82,12 @@ class ParameterSupportTestParser(Parser):
             return False
 
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
-                # Check if it has the parameter_support_tests structure
-                return "parameter_support_tests" in data and "results" in data.get("parameter_support_tests", {})
+            # Most JSON reports belong to other parsers, so rule them out before decoding
+            if not _file_contains(filepath, _PARAMETER_SUPPORT_TESTS_KEY):
+                return False
+            data = _load_report(filepath)
+            # Check if it has the parameter_support_tests structure
+            return "parameter_support_tests" in data and "results" in data.get("parameter_support_tests", {})
         except (json.JSONDecodeError, IOError, KeyError) as e:
             logger.error(f"Failed to load JSON from {filepath}: {e}")
             return False
@@ -61,8 +101,7 @@ class ParameterSupportTestParser(Parser):
         logger.info(f"Parsing parameter support tests from {filepath}")
 
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            data = _load_report(filepath)
         except (json.JSONDecodeError, IOError) as e:
             logger.error(f"Failed to load JSON from {filepath}: {e}")
             return []
@@ -79,23 +118,31 @@ class ParameterSupportTestParser(Parser):
             **filtered_metadata,
         }  # metadata values take precedence (except 'results')
 
-        tests = []
-        for test_group_name, test_case_results in param_support_tests.get("results", {}).items():
-            for test_case in test_case_results:
-                test = self._create_test_from_case(
-                    param_support_tests=param_support_tests,
+        # Config and tags are the same for every test case of the report
+        config = asdict(ParameterSupportTestConfig.from_dict(param_support_tests))
+        tags = asdict(ParameterSupportTestTags())
+
+        tests = [
+            test
+            for test_group_name, test_case_results in param_support_tests.get("results", {}).items()
+            for test_case in test_case_results
+            if (
+                test := self._create_test_from_case(
+                    config=config,
+                    tags=tags,
                     test_group_name=test_group_name,
                     test_case=test_case,
                 )
-                if test:
-                    tests.append(test)
+            )
+        ]
 
         logger.info(f"Parsed {len(tests)} parameter support tests from {filepath}")
         return tests
 
     def _create_test_from_case(
         self,
-        param_support_tests: dict,
+        config: dict,
+        tags: dict,
         test_group_name: str,
         test_case: dict,
     ) -> Optional[Test]:
@@ -112,18 +159,13 @@ class ParameterSupportTestParser(Parser):
 
         status = test_case.get("status", "unknown").lower()
         message = test_case.get("message", "")
-        success = status in ["passed", "success", "pass", "ok"]
-        failed = status in ["failed", "failure", "fail", "error"]
-        skipped = status in ["skipped", "skip"]
+        success, failed, skipped = _STATUS_FLAGS.get(status, _UNKNOWN_STATUS_FLAGS)
 
         error_message = None
         if failed or skipped:
             error_message = message
 
         full_test_name = test_case.get("test_id", "unknown")
-        config = ParameterSupportTestConfig.from_dict(param_support_tests)
-        tags = ParameterSupportTestTags()
-
         try:
             return Test(
                 test_start_ts=test_start_ts,
@@ -137,8 +179,8 @@ class ParameterSupportTestParser(Parser):
                 success=success,
                 skipped=skipped,
                 full_test_name=full_test_name,
-                config=asdict(config),
-                tags=asdict(tags),
+                config=config,
+                tags=tags,
             )
         except ValidationError as e:
             failure_happened()
@@ -3,14 +3,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from loguru import logger
-from functools import partial
 from pydantic_models import Test
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 from .parser import Parser
 from . import junit_xml_utils
 from utils import parse_timestamp
-import ast
 import html
 from pydantic import ValidationError
 from shared import failure_happened, is_valid_testcase_
@@ -22,10 +20,7 @@ class PythonPytestParser(Parser):
     def can_parse(self, filepath: str):
         if not filepath.endswith(".xml"):
             return False
-        report_root_tree = junit_xml_utils.get_xml_file_root_element_tree(filepath)
-        report_root = report_root_tree.getroot()
-        is_pytest = junit_xml_utils.is_pytest_junit_xml(report_root)
-        return is_pytest
+        return junit_xml_utils.is_pytest_junit_xml_file(filepath)
 
     def parse(
         self,
@@ -37,41 +32,38 @@ class PythonPytestParser(Parser):
 
 
 def get_tests(filepath):
-    report_root_tree = junit_xml_utils.get_xml_file_root_element_tree(filepath)
-    report_root = report_root_tree.getroot()
-    testsuite = report_root[0]
-    default_timestamp = parse_timestamp(testsuite.attrib["timestamp"])
-    get_pydantic_test = partial(get_pydantic_test_from_pytest_testcase_, default_timestamp=default_timestamp)
+    testsuite_read = False
     tests = []
-    for testcase in testsuite:
+    for testsuite, testcase in junit_xml_utils.iter_pytest_testcases(filepath):
+        if not testsuite_read:
+            # The testsuite attributes are available once its first testcase has been streamed
+            default_timestamp = parse_timestamp(testsuite.attrib["timestamp"])
+            testsuite_read = True
         if is_valid_testcase_(testcase):
-            tests.append(get_pydantic_test(testcase))
+            tests.append(get_pydantic_test_from_pytest_testcase_(testcase, default_timestamp))
     return tests
 
 
-def get_pydantic_test_from_pytest_testcase_(testcase, default_timestamp=datetime.now()):
-    skipped = junit_xml_utils.get_pytest_testcase_is_skipped(testcase)
-    failed = junit_xml_utils.get_pytest_testcase_is_failed(testcase)
-    error = junit_xml_utils.get_pytest_testcase_is_error(testcase)
+def get_pydantic_test_from_pytest_testcase_(testcase, default_timestamp):
+    properties, skipped_element, failure_element, error_element = junit_xml_utils.scan_pytest_testcase(testcase)
+    skipped = skipped_element is not None
+    failed = failure_element is not None
+    error = error_element is not None
     success = not (failed or error)
 
     error_message = None
 
     # Error is a scarier thing than failure because it means there's an infra error, expose that first
     if failed:
-        error_message = junit_xml_utils.get_pytest_failure_message(testcase)
+        error_message = failure_element.attrib["message"]
 
     if error:
-        error_message = junit_xml_utils.get_pytest_error_message(testcase)
+        error_message = error_element.attrib["message"]
 
     if skipped:
-        error_message = junit_xml_utils.get_pytest_skipped_message(testcase)
+        error_message = f"[{skipped_element.attrib['type']}] {skipped_element.attrib['message']}"
 
-    properties = {}
-    try:
-        properties = junit_xml_utils.get_pytest_testcase_properties(testcase)
-    except:
-        pass
+    properties = properties or {}
 
     # Fallback to manual error_message if provided and not set automatically
     if error_message is None:
@@ -90,10 +82,9 @@ def get_pydantic_test_from_pytest_testcase_(testcase, default_timestamp=datetime
         test_start_ts = default_timestamp
         test_end_ts = default_timestamp + timedelta(seconds=test_duration)
 
-    test_case_name = testcase.attrib["name"].split("[")[0]
+    test_case_name = testcase.attrib["name"].partition("[")[0]
 
-    filepath_no_ext = testcase.attrib["classname"].replace(".", "/")
-    filepath = f"{filepath_no_ext}.py"
+    filepath = junit_xml_utils.classname_to_filepath(testcase.attrib["classname"])
 
     def get_category_from_pytest_testcase_(testcase_):
         # TODO Adjust to project specific test categories
@@ -120,14 +111,14 @@ def get_pydantic_test_from_pytest_testcase_(testcase, default_timestamp=datetime
     try:
         tag_string = properties.get("tags")
         if tag_string is not None:
-            tags = ast.literal_eval(html.unescape(tag_string))
+            tags = junit_xml_utils.parse_literal_property(html.unescape(tag_string))
     except (ValueError, SyntaxError, TypeError) as e:
         print(f"Error parsing tags: {e}")
 
     try:
         config_string = properties.get("config")
         if config_string is not None:
-            config = ast.literal_eval(html.unescape(config_string))
+            config = junit_xml_utils.parse_literal_property(html.unescape(config_string))
     except (ValueError, SyntaxError, TypeError) as e:
         print(f"Error parsing config: {e}")
 
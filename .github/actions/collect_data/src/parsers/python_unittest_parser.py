@@ -1,14 +1,21 @@
 # SPDX-FileCopyrightText: (c) 2024 Tenstorrent AI ULC
 #
 # SPDX-License-Identifier: Apache-2.0
-import xmltodict
+import os
+from defusedxml.ElementTree import iterparse as XMLIterParse
 from loguru import logger
 from pydantic_models import Test
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 from .parser import Parser
-from pydantic import ValidationError
-from shared import failure_happened
+from pydantic import TypeAdapter
+from shared import validate_rows
+from utils import ensure_timezone
+
+_TESTS_ADAPTER = TypeAdapter(List[Test])
+
+# iterparse pulls 16 KiB at a time, a larger buffer batches those into fewer reads
+_REPORT_BUFFER_SIZE = 1024 * 1024
 
 
 class PythonUnittestParser(Parser):
@@ -27,88 +34,131 @@ class PythonUnittestParser(Parser):
 
 
 def get_tests(test_report_path):
-    tests = []
-    with open(test_report_path) as f:
-        data = f.read()
-        dict_data = xmltodict.parse(data, disable_entities=False)
-        previous_test_end_ts = None
-
-        testsuites = dict_data["testsuites"]["testsuite"]
-        if not isinstance(testsuites, list):
-            testsuites = [testsuites]
-
-        # Workaround: If testcases does not have timestamp, try using timestamp from testsuite and add duration
-        if "@timestamp" not in testsuites[0]["testcase"][0]:
-            logger.warning("Timestamp not found in test report, using testsuite timestamp")
-            previous_test_end_ts = testsuites[0].get("@timestamp", None)
-            # if testsuites does not have timestamp, use current time
-            if not previous_test_end_ts:
-                logger.warning("Timestamp not found in testsuite, using current time")
-                previous_test_end_ts = datetime.now().isoformat()
-
-        if "@file" not in testsuites[0]["testcase"][0]:
-            logger.warning("Filepath not found in test report.")
-
-        for testsuite in testsuites:
-
-            # testcases can be dict or list
-            testcases = testsuite["testcase"]
-            if not isinstance(testcases, list):
-                testcases = [testcases]
-
-            for testcase in testcases:
-                message = None
-                test_start_ts = testcase.get("@timestamp", previous_test_end_ts)
-                duration = float(testcase["@time"])
-                if duration == 0:
-                    duration = 0.01
-                skipped = testcase.get("skipped", False)
-                error = testcase.get("error", False)
-                failure = testcase.get("failure", False)
-                file = testcase.get("@file", "")
-                if skipped:
-                    message = testcase["skipped"]["@message"]
-                if error:
-                    message = testcase["error"]["@type"]
-                    message += "\n" + testcase["error"]["@message"]
-                    message += "\n" + testcase["error"]["#text"]
-                if failure:
-                    message = testcase["failure"]["@type"]
-                    message += "\n" + testcase["failure"]["@message"]
-                    message += "\n" + testcase["failure"]["#text"]
-
-                # Workaround: Data team requres unique test_start_ts
-                if previous_test_end_ts:
-                    test_start_ts = max(test_start_ts, previous_test_end_ts)
-                test_end_ts = add_time(test_start_ts, duration)
-
-                try:
-                    test = Test(
-                        test_start_ts=test_start_ts,
-                        test_end_ts=test_end_ts,
-                        test_case_name=testcase["@name"],
-                        filepath=file,
-                        category=testcase["@classname"],
-                        group="unittest",
-                        owner=None,
-                        error_message=message,
-                        success=not (error or failure),
-                        skipped=bool(skipped),
-                        full_test_name=f"{file}::{testcase['@name']}",
-                        config=None,
-                        tags=None,
-                    )
-                    tests.append(test)
-                except ValidationError as e:
-                    failure_happened()
-                    logger.error(f"Validation error: {e}")
-
-                previous_test_end_ts = test_end_ts
-    return tests
-
-
-def add_time(timestamp_iso, duration_seconds):
-    parsed_timestamp = datetime.fromisoformat(timestamp_iso)
-    delta = timedelta(seconds=float(duration_seconds))
-    result = parsed_timestamp + delta
-    return result.isoformat()
+    rows = []
+    previous_test_end_dt = None
+    first_testcase = True
+
+    for testsuite, testcase in _iter_testcases(test_report_path):
+        if first_testcase:
+            first_testcase = False
+            # Workaround: If testcases does not have timestamp, try using timestamp from testsuite and add duration
+            if "timestamp" not in testcase.attrib:
+                logger.warning("Timestamp not found in test report, using testsuite timestamp")
+                testsuite_ts = testsuite.get("timestamp", None)
+                # if testsuites does not have timestamp, use current time
+                if testsuite_ts:
+                    previous_test_end_dt = datetime.fromisoformat(testsuite_ts)
+                else:
+                    logger.warning("Timestamp not found in testsuite, using current time")
+                    previous_test_end_dt = datetime.now()
+
+            if "file" not in testcase.attrib:
+                logger.warning("Filepath not found in test report.")
+
+        message = None
+        test_start_ts = testcase.get("timestamp")
+        duration = float(testcase.attrib["time"])
+        if duration == 0:
+            duration = 0.01
+        skipped = _get_child_value(testcase, "skipped")
+        error = _get_child_value(testcase, "error")
+        failure = _get_child_value(testcase, "failure")
+        file = testcase.get("file", "")
+        if skipped:
+            message = skipped["@message"]
+        if error:
+            message = error["@type"]
+            message += "\n" + error["@message"]
+            message += "\n" + error["#text"]
+        if failure:
+            message = failure["@type"]
+            message += "\n" + failure["@message"]
+            message += "\n" + failure["#text"]
+
+        test_start_dt = previous_test_end_dt if test_start_ts is None else datetime.fromisoformat(test_start_ts)
+        # Workaround: Data team requres unique test_start_ts
+        # Reports can mix timestamps with and without an offset, naive ones are compared as UTC
+        if previous_test_end_dt is not None and ensure_timezone(previous_test_end_dt) > ensure_timezone(test_start_dt):
+            test_start_dt = previous_test_end_dt
+        test_end_dt = test_start_dt + timedelta(seconds=duration)
+
+        rows.append(
+            dict(
+                test_start_ts=test_start_dt,
+                test_end_ts=test_end_dt,
+                test_case_name=testcase.attrib["name"],
+                filepath=file,
+                category=testcase.attrib["classname"],
+                group="unittest",
+                owner=None,
+                error_message=message,
+                success=not (error or failure),
+                skipped=bool(skipped),
+                full_test_name=f"{file}::{testcase.attrib['name']}",
+                config=None,
+                tags=None,
+            )
+        )
+
+        previous_test_end_dt = test_end_dt
+
+    return validate_rows(_TESTS_ADAPTER, Test, rows)
+
+
+def _iter_testcases(test_report_path):
+    """
+    Stream (testsuite, testcase) pairs for every testsuite of the report,
+    detaching each testcase and testsuite once it has been consumed.
+    """
+    depth = 0
+    root = None
+    testsuite = None
+
+    with open(test_report_path, "rb", buffering=_REPORT_BUFFER_SIZE) as f:
+        _advise_sequential(f)
+        for event, element in XMLIterParse(f, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    if element.tag != "testsuites":
+                        raise KeyError("testsuites")
+                    root = element
+                elif depth == 2:
+                    testsuite = element if element.tag == "testsuite" else None
+                continue
+
+            depth -= 1
+            if depth == 2 and testsuite is not None and element.tag == "testcase":
+                yield testsuite, element
+                testsuite.remove(element)
+            elif depth == 1:
+                root.remove(element)
+
+
+def _advise_sequential(f):
+    """
+    Hint the kernel to read ahead aggressively, reports are scanned once front to back.
+    """
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        # Not available on every platform and purely an optimisation
+        pass
+
+
+def _get_child_value(testcase, tag):
+    """
+    Read a <skipped>, <error> or <failure> child the way the report used to be
+    read through xmltodict: None when absent or empty, the stripped text when it
+    has no attributes, otherwise a dict of "@"-prefixed attributes and "#text".
+    """
+    child = testcase.find(tag)
+    if child is None:
+        return None
+    text = (child.text or "").strip() or None
+    if not child.attrib:
+        return text
+    value = {f"@{name}": attribute for name, attribute in child.attrib.items()}
+    if text is not None:
+        value["#text"] = text
+    return value
@@ -4,8 +4,8 @@
 
 import tarfile
 import os
-import json
 from functools import partial
+from itertools import chain, starmap
 from loguru import logger
 from datetime import datetime
 from pydantic_models import OpTest, TensorDesc
@@ -14,6 +14,7 @@ from enum import IntEnum
 from typing import Optional
 from pydantic import ValidationError
 from shared import failure_happened
+from utils import load_json_bytes
 
 
 class OpCompilationStatus(IntEnum):
@@ -27,6 +28,9 @@ class OpCompilationStatus(IntEnum):
     EXECUTED = 7
 
 
+_STATUS_NAMES = {status.value: status.name for status in OpCompilationStatus}
+
+
 class TTTorchModelTestsParser(Parser):
     """Parser for python unitest report files."""
 
@@ -43,50 +47,57 @@ class TTTorchModelTestsParser(Parser):
         return _get_tests(filepath, project, github_job_id)
 
 
-def _untar(filepath):
-    basename = os.path.basename(filepath)
-    path = f"/tmp/{basename}"
+def _iter_json_members(filepath):
+    """
+    Yield (path, bytes) for every JSON report in the tarball, read straight
+    from the archive. Paths keep the /tmp/<tarball> prefix the reports used to
+    be extracted under, since they end up in full_test_name.
+    """
+    path = f"/tmp/{os.path.basename(filepath)}"
     with tarfile.open(filepath, "r") as fd:
-        fd.extractall(path=path)
-    return path
-
-
-def _all_json_files(filepath):
-    for root, dirs, files in os.walk(filepath):
-        for file in files:
-            if file.endswith(".json") and not file.startswith("."):
-                yield os.path.join(root, file)
-
-
-def _get_tests_from_json(project, github_job_id, filepath):
-    with open(filepath, "r") as fd:
-        data = json.load(fd)
-
+        for member in fd:
+            if not member.isfile():
+                continue
+            basename = os.path.basename(member.name)
+            if not basename.endswith(".json") or basename.startswith("."):
+                continue
+            f = fd.extractfile(member)
+            if f is not None:
+                yield os.path.normpath(os.path.join(path, member.name)), f.read()
+
+
+def _get_tests_from_json(project, github_job_id, filepath, blob):
+    data = load_json_bytes(blob)
+
+    timestamp = datetime.now()
+    model_name = os.path.basename(filepath).split(".", 1)[0]
+    test_name_prefix = f"{filepath}::"
     for name, test in data.items():
-        yield _get_pydantic_test(filepath, name, test, project, github_job_id)
+        yield _get_pydantic_test(filepath, test_name_prefix, model_name, name, test, project, github_job_id, timestamp)
 
 
-def _get_pydantic_test(filepath, name, test, project, github_job_id, default_timestamp=datetime.now()):
-    status = OpCompilationStatus(test["compilation_status"])
+def _get_pydantic_test(filepath, test_name_prefix, model_name, name, test, project, github_job_id, timestamp):
+    status = test["compilation_status"]
+    try:
+        error_message = _STATUS_NAMES[status]
+    except KeyError:
+        raise ValueError(f"{status!r} is not a valid OpCompilationStatus") from None
 
     skipped = False
     failed = status < OpCompilationStatus.EXECUTED
     error = False
     success = not (failed or error)
-    error_message = str(status).split(".")[1]
 
     properties = {}
 
-    test_start_ts = default_timestamp
-    test_end_ts = default_timestamp
-
-    model_name = os.path.basename(filepath).split(".")[0]
+    test_start_ts = timestamp
+    test_end_ts = timestamp
 
     # leaving empty for now
     group = None
     owner = None
 
-    full_test_name = f"{filepath}::{name}"
+    full_test_name = test_name_prefix + name
 
     # to be populated with [] if available
     config = None
@@ -123,21 +134,23 @@ def _get_pydantic_test(filepath, name, test, project, github_job_id, default_tim
 def _map_tensor_desc(tensors):
     if not tensors:
         return []
-    for tensor in tensors:
-        yield TensorDesc(
-            shape=tensor.get("shape"),
-            data_type=tensor.get("data_type"),
-            buffer_type=tensor.get("buffer_type"),
-            layout=tensor.get("layout"),
-            grid_shape=tensor.get("grid_shape"),
-        )
+    return [_get_tensor_desc(tensor) for tensor in tensors]
+
+
+def _get_tensor_desc(tensor):
+    return TensorDesc.from_values(
+        shape=tensor.get("shape"),
+        data_type=tensor.get("data_type"),
+        buffer_type=tensor.get("buffer_type"),
+        layout=tensor.get("layout"),
+        grid_shape=tensor.get("grid_shape"),
+    )
 
 
 def _flatten(list_of_lists):
-    return [item for sublist in list_of_lists for item in sublist]
+    return list(chain.from_iterable(list_of_lists))
 
 
 def _get_tests(filepath, project, github_job_id):
-    untar_path = _untar(filepath)
-    tests = map(partial(_get_tests_from_json, project, github_job_id), _all_json_files(untar_path))
+    tests = starmap(partial(_get_tests_from_json, project, github_job_id), _iter_json_members(filepath))
     return _flatten(tests)
@@ -3,8 +3,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
-import json
 from functools import partial
+from itertools import chain
 from loguru import logger
 from datetime import datetime
 from pydantic_models import OpTest, TensorDesc
@@ -12,6 +12,7 @@ from .parser import Parser
 from typing import Optional
 from pydantic import ValidationError
 from shared import failure_happened
+from utils import load_json_file
 
 
 class TTXlaOpByOpParser(Parser):
@@ -45,8 +46,7 @@ def _all_json_files(filepath):
 
 
 def _get_tests_from_json(project, github_job_id, filepath):
-    with open(filepath, "r") as fd:
-        data = json.load(fd)
+    data = load_json_file(filepath)
 
     # Extract OpTest entries from tests/user_properties
     tests = data.get("tests") or []
@@ -190,7 +190,7 @@ def _parse_tensor_desc_list(tensor_str):
 
 
 def _flatten(list_of_lists):
-    return [item for sublist in list_of_lists for item in sublist if item is not None]
+    return [item for item in chain.from_iterable(list_of_lists) if item is not None]
 
 
 def _get_tests(filepath, project, github_job_id):
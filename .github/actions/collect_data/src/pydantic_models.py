@@ -314,6 +314,28 @@ class TensorDesc(BaseModel):
         "meaning each core has a 64x64 slice."
     )
 
+    @classmethod
+    def from_values(cls, shape, data_type, buffer_type, layout, grid_shape) -> "TensorDesc":
+        """
+        Build a TensorDesc, skipping validation when every value already has its
+        field type, which is the common case for parsed reports.
+        """
+        if (
+            _is_int_list(shape)
+            and _is_int_list(grid_shape)
+            and type(data_type) is str
+            and type(buffer_type) is str
+            and type(layout) is str
+        ):
+            return cls.model_construct(
+                shape=shape, data_type=data_type, buffer_type=buffer_type, layout=layout, grid_shape=grid_shape
+            )
+        return cls(shape=shape, data_type=data_type, buffer_type=buffer_type, layout=layout, grid_shape=grid_shape)
+
+
+def _is_int_list(value) -> bool:
+    return type(value) is list and all(type(item) is int for item in value)
+
 
 class TestStatus(Enum):
     """
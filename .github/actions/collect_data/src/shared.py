@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from loguru import logger
+from pydantic import ValidationError
 
 report_failure = False
 
@@ -30,3 +31,27 @@ def is_valid_testcase_(testcase) -> bool:
         return False
     else:
         return True
+
+
+def _report_validation_error(fields, error) -> None:
+    failure_happened()
+    logger.error(f"Validation error: {error}")
+
+
+def validate_rows(adapter, model, rows, on_error=_report_validation_error) -> list:
+    """
+    Validate a list of field dicts in one pass with a TypeAdapter over List[model].
+
+    If any row is invalid, the rows are validated one by one instead so that only
+    the offending ones are dropped; on_error(fields, error) is called for each of them.
+    """
+    try:
+        return adapter.validate_python(rows)
+    except ValidationError:
+        valid = []
+        for fields in rows:
+            try:
+                valid.append(model(**fields))
+            except ValidationError as e:
+                on_error(fields, e)
+        return valid
@@ -4,25 +4,41 @@
 
 import os
 import enum
+import json
+import math
+import mmap
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 import subprocess
 from loguru import logger
+import orjson
 import pydantic_models
 
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
 class InfraErrorV1(enum.Enum):
     GENERIC_SET_UP_FAILURE = enum.auto()
 
 
 _FRACTION_RE = re.compile(r"\.(\d+)")
+# Normalized timestamps that datetime.fromisoformat parses exactly like the strptime formats below
+_ISO_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{6})?(?:[+-]\d{2}:\d{2})?\Z")
 
 
+@lru_cache(maxsize=4096)
 def parse_timestamp(timestamp: str) -> Optional[datetime]:
     """
     Parse ISO-8601-like timestamps with optional timezone and fractional seconds.
 
+    Results are cached: reports and jobs repeat the same timestamps, and the
+    returned datetimes are immutable.
+
     Supports:
     - Z or +00:00 timezone
     - 0–9 fractional second digits (truncated to microseconds)
@@ -47,6 +63,13 @@ def parse_timestamp(timestamp: str) -> Optional[datetime]:
         frac = m.group(1)[:6].ljust(6, "0")
         ts = ts[: m.start(1)] + frac + ts[m.end(1) :]
 
+    if _ISO_TIMESTAMP_RE.match(ts):
+        try:
+            return datetime.fromisoformat(ts)
+        except ValueError:
+            # Out-of-range fields; the formats below reject them too
+            pass
+
     formats = (
         "%Y-%m-%dT%H:%M:%S.%f%z",
         "%Y-%m-%dT%H:%M:%S.%f",
@@ -76,6 +99,97 @@ def ensure_timezone(value: Optional[datetime]) -> Optional[datetime]:
     return value
 
 
+# Below this size, setting up a memory map costs more than a plain read
+_JSON_MMAP_THRESHOLD = 256 * 1024
+
+
+def load_json_file(path) -> Any:
+    """
+    Load a JSON file with orjson, falling back to the standard library for
+    documents orjson rejects (e.g. NaN/Infinity literals written by json.dump).
+    Large files are memory-mapped and decoded in place instead of being copied
+    into an intermediate bytes object.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _JSON_MMAP_THRESHOLD:
+            return load_json_bytes(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return load_json_bytes(view)
+
+
+def load_json_bytes(data) -> Any:
+    """
+    Decode an in-memory JSON document with the same orjson-then-json fallback
+    as load_json_file.
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(bytes(data))
+
+
+def walk_files(top: str, skip_dir: Optional[Callable[[os.DirEntry], bool]] = None) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Yield (dir_path, entry) for every non-directory entry under top.
+
+    Equivalent to iterating the files of os.walk(top) in the same order, but
+    built on os.scandir so the DirEntry type information is reused instead of
+    being re-queried with a stat call per entry. Symlinked directories are not
+    followed and a missing top directory yields nothing, as with os.walk.
+
+    Subdirectories for which skip_dir returns True are pruned without being listed.
+    """
+    stack = [top]
+    while stack:
+        dir_path = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        yield dir_path, entry
+                    elif not entry.is_symlink() and not (skip_dir and skip_dir(entry)):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def parallel_imap(
+    func: Callable[[T], R], items: Iterable[T], min_items: int = 8, max_workers: Optional[int] = None
+) -> Iterator[R]:
+    """
+    Lazily apply func to every item across a process pool, preserving input order.
+
+    Inputs with fewer than min_items entries, or hosts with a single CPU, are
+    mapped serially since process start-up would outweigh the work. func and
+    the items must be picklable, so func has to be a module-level callable.
+    """
+    items = list(items)
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+    if len(items) < min_items or workers < 2:
+        yield from map(func, items)
+        return
+    # One chunk per worker keeps pickling of shared arguments to a minimum
+    chunksize = math.ceil(len(items) / workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(func, items, chunksize=chunksize)
+
+
+def parallel_map(
+    func: Callable[[T], R], items: Iterable[T], min_items: int = 8, max_workers: Optional[int] = None
+) -> List[R]:
+    """
+    Apply func to every item across a process pool, preserving input order.
+    See parallel_imap.
+    """
+    return list(parallel_imap(func, items, min_items, max_workers))
+
+
 def get_data_pipeline_datetime_from_datetime(requested_datetime: datetime) -> str:
     return requested_datetime.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
 
@@ -2,12 +2,14 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 import pytest
+from loguru import logger
 from unittest.mock import MagicMock
 from benchmark import (
     ShieldBenchmarkDataMapper,
     VllmBenchmarkDataMapper,
     GuideLLMBenchmarkDataMapper,
     CompleteBenchmarkRun,
+    _get_model_reports,
 )
 
 
@@ -1119,3 +1121,30 @@ def test_acceptance_config_params_does_not_mutate_model_spec(mapper, pipeline):
     }
     mapper.map_benchmark_data(pipeline, 1, report_data, model_spec_data)
     assert model_spec_data == {"model_id": "test_model"}
+
+
+def test_get_model_reports_skips_hidden_files(tmp_path):
+    artifacts_dir = tmp_path / "42" / "artifacts" / "perf-reports"
+    artifacts_dir.mkdir(parents=True)
+    (artifacts_dir / "report_7.json").write_text("{}")
+    (artifacts_dir / "._report_7.json").write_text("")
+    (artifacts_dir / "report_7.txt").write_text("")
+
+    reports = _get_model_reports(str(tmp_path), 42)
+
+    assert reports == {7: [str(artifacts_dir / "report_7.json")]}
+
+
+def test_create_measurements_warns_on_none_values(mapper, pipeline):
+    warnings = []
+    sink_id = logger.add(warnings.append, level="WARNING", format="{message}")
+    try:
+        measurements = mapper._create_measurements(
+            pipeline.jobs[0], "benchmark", {"ttft": 1.5, "tput": None}, ["ttft", "tput", "missing"]
+        )
+    finally:
+        logger.remove(sink_id)
+
+    assert [m.name for m in measurements] == ["ttft"]
+    assert len(warnings) == 1
+    assert "'tput'" in warnings[0] and "missing" not in warnings[0]
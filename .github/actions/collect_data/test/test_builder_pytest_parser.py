@@ -18,3 +18,13 @@ def test_builder_pytest_parser(filename: str, expected: dict[str, Any]):
     assert parser.can_parse(filepath)
     tests = parser.parse(filepath)
     assert len(tests) == expected["num_tests"]
+
+
+def test_builder_pytest_parser_rejects_multiple_testsuites(tmp_path):
+    with open(os.path.join(REPORTS_PATH, "binoptests.xml")) as f:
+        report = f.read()
+    second_testsuite = '  <testsuite name="pytest" tests="0" timestamp="2025-08-15T19:40:00+00:00" />\n</testsuites>'
+    filepath = tmp_path / "multi_suite.xml"
+    filepath.write_text(report.replace("</testsuites>", second_testsuite))
+
+    assert not BuilderPytestParser().can_parse(str(filepath))
@@ -4,6 +4,8 @@
 
 from generate_data import create_pipeline_json, create_benchmark_jsonl
 from benchmark import create_json_from_report
+from functools import partial
+from utils import parallel_map
 import os
 import json
 import pytest
@@ -118,6 +120,29 @@ def test_check_benchmark_project(run_id, expected_project):
     assert reports[0].git_repo_name == expected_project
 
 
+def test_create_pipeline_json_process_pool(monkeypatch):
+    """
+    Parsing test reports in worker processes must attach the same tests to each job as the serial path
+    """
+    os.environ["GITHUB_EVENT_NAME"] = "test"
+
+    def job_tests(pipeline):
+        return [(job.github_job_id, [test.full_test_name for test in job.tests]) for job in pipeline.jobs]
+
+    kwargs = dict(
+        workflow_filename="test/data/12083382635/workflow.json",
+        jobs_filename="test/data/12083382635/workflow_jobs.json",
+        workflow_outputs_dir="test/data",
+    )
+    serial_pipeline, _ = create_pipeline_json(**kwargs)
+
+    monkeypatch.setattr("cicd.parallel_map", partial(parallel_map, min_items=1, max_workers=2))
+    pooled_pipeline, _ = create_pipeline_json(**kwargs)
+
+    assert sum(len(job.tests) for job in serial_pipeline.jobs) > 0
+    assert job_tests(pooled_pipeline) == job_tests(serial_pipeline)
+
+
 def check_constraint(pipeline):
     # check if the pipeline has the correct constraints
     # unique cicd_job_id, full_test_name, test_start_ts
@@ -53,6 +53,13 @@ def test_cannot_parse_non_json():
     assert parser.can_parse("test.xml") is False
 
 
+def test_cannot_parse_other_json(tmp_path):
+    parser = ParameterSupportTestParser()
+    report = tmp_path / "report.json"
+    report.write_text(json.dumps({"tests": [], "results": {"test_n": []}}))
+    assert parser.can_parse(str(report)) is False
+
+
 def test_parse_parameter_support_tests(sample_parameter_support_json):
     parser = ParameterSupportTestParser()
     tests = parser.parse(sample_parameter_support_json)
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: (c) 2026 Tenstorrent AI ULC
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from datetime import datetime
+from parsers.python_unittest_parser import PythonUnittestParser
+
+REPORT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+    <testsuite name="suite" timestamp="2024-11-25T09:51:10">
+        <testcase name="test_pass" classname="test.module" file="test/module.py" time="1.5"/>
+        <testcase name="test_empty_skip" classname="test.module" file="test/module.py" time="0"><skipped/></testcase>
+        <testcase name="test_skip" classname="test.module" file="test/module.py" time="0">
+            <skipped type="skip" message="not supported"/>
+        </testcase>
+        <testcase name="test_fail" classname="test.module" file="test/module.py" time="2">
+            <failure type="AssertionError" message="1 != 2">
+                Traceback
+            </failure>
+        </testcase>
+    </testsuite>
+    <testsuite name="other" timestamp="2024-11-25T09:52:00">
+        <testcase name="test_error" classname="test.other" file="test/other.py" time="1">
+            <error type="RuntimeError" message="boom">Traceback</error>
+        </testcase>
+    </testsuite>
+</testsuites>
+"""
+
+MIXED_OFFSETS_REPORT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+    <testsuite name="suite">
+        <testcase name="test_a" classname="test.module" timestamp="2024-11-25T09:51:10+00:00" time="5"/>
+        <testcase name="test_b" classname="test.module" timestamp="2024-11-25T09:51:12" time="1"/>
+        <testcase name="test_c" classname="test.module" timestamp="2024-11-25T10:00:00" time="1"/>
+    </testsuite>
+</testsuites>
+"""
+
+
+@pytest.fixture
+def report_path(tmp_path):
+    path = tmp_path / "report.xml"
+    path.write_text(REPORT)
+    return str(path)
+
+
+def test_python_unittest_parser(report_path):
+    parser = PythonUnittestParser()
+    assert parser.can_parse(report_path)
+    tests = parser.parse(report_path)
+
+    assert [test.test_case_name for test in tests] == [
+        "test_pass",
+        "test_empty_skip",
+        "test_skip",
+        "test_fail",
+        "test_error",
+    ]
+    assert [(test.success, test.skipped) for test in tests] == [
+        (True, False),
+        # An empty <skipped/> element carries no skip information
+        (True, False),
+        (True, True),
+        (False, False),
+        (False, False),
+    ]
+    assert tests[2].error_message == "not supported"
+    assert tests[3].error_message == "AssertionError\n1 != 2\nTraceback"
+    assert tests[4].error_message == "RuntimeError\nboom\nTraceback"
+    assert tests[4].full_test_name == "test/other.py::test_error"
+
+    # Testcases without timestamps are laid out back to back from the first testsuite timestamp
+    for previous, test in zip(tests, tests[1:]):
+        assert test.test_start_ts == previous.test_end_ts
+
+
+def test_python_unittest_parser_mixed_timestamp_offsets(tmp_path):
+    path = tmp_path / "report.xml"
+    path.write_text(MIXED_OFFSETS_REPORT)
+
+    tests = PythonUnittestParser().parse(str(path))
+
+    # Naive timestamps are compared as UTC, so test_b is moved to where test_a ended
+    assert tests[1].test_start_ts == tests[0].test_end_ts
+    assert tests[2].test_start_ts == datetime(2024, 11, 25, 10, 0, 0)
@@ -35,3 +35,15 @@ def test_tt_torch_full_model_tests_parser_custom_error_message():
     # Check that if a test is skipped, the error message pulls the pytest.skip message
     # instead of the custom error message when both are present
     assert "[pytest.skip]" in tests[2].error_message
+
+
+@pytest.mark.parametrize(
+    "filepath, expected",
+    [
+        ("test/data/tt_torch_models/mnist.xml", True),
+        ("test/data/12007373278/artifacts/test-reports-runner/report_33467916002.xml", False),
+        ("test/data/12083382635/artifacts/report_33696401643.xml", False),
+    ],
+)
+def test_pytest_parser_can_parse(filepath, expected):
+    assert PythonPytestParser().can_parse(filepath) is expected
@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import tarfile
 import pytest
 from parsers.tt_torch_model_tests_parser import TTTorchModelTestsParser
 
@@ -19,3 +21,17 @@ def test_tt_torch_model_tests_parser(tar, project, github_job_id, expected):
     tests = parser.parse(filepath, project=project, github_job_id=github_job_id)
     # If the parser fails, it returns a list of None.
     assert len(list(filter(None, tests))) == expected["tests_cnt"]
+
+
+def test_tt_torch_model_tests_parser_dot_prefixed_members(tmp_path):
+    report_dir = tmp_path / "models"
+    report_dir.mkdir()
+    (report_dir / "m1.json").write_text(json.dumps({"t1": {"compilation_status": 7}}))
+    filepath = str(tmp_path / "run_dot.tar")
+    with tarfile.open(filepath, "w") as fd:
+        fd.add(report_dir, arcname="./models")
+
+    tests = TTTorchModelTestsParser().parse(filepath, project="tt-torch", github_job_id=5)
+
+    assert [test.full_test_name for test in tests] == ["/tmp/run_dot.tar/models/m1.json::t1"]
+    assert tests[0].filepath == "/tmp/run_dot.tar/models/m1.json"
@@ -2,9 +2,21 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import math
+import os
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
-from utils import get_job_row_from_github_job
+from utils import (
+    get_job_row_from_github_job,
+    load_json_file,
+    parallel_imap,
+    parallel_map,
+    parse_timestamp,
+    walk_files,
+)
 
 
 @pytest.fixture
@@ -76,3 +88,75 @@ def test_skip_log_download_avoids_fetch(monkeypatch, failed_job):
     # than becoming an exception string from extract_error_lines_from_logs(None).
     assert row["failure_signature"] is None
     assert row["failure_description"] is None
+
+
+def test_load_json_file_falls_back_for_nan(tmp_path):
+    path = tmp_path / "report.json"
+    path.write_text('{"value": NaN, "name": "latency"}')
+
+    data = load_json_file(path)
+
+    assert data["name"] == "latency"
+    assert math.isnan(data["value"])
+
+
+def test_walk_files_matches_os_walk():
+    data_dir = os.path.join(os.path.dirname(__file__), "data")
+    expected = [os.path.join(root, f) for root, _, files in os.walk(data_dir) for f in files]
+
+    assert [entry.path for _, entry in walk_files(data_dir)] == expected
+    assert list(walk_files(os.path.join(data_dir, "does-not-exist"))) == []
+
+
+def test_walk_files_prunes_skipped_dirs():
+    data_dir = os.path.join(os.path.dirname(__file__), "data")
+    expected = []
+    for root, dirs, files in os.walk(data_dir):
+        dirs[:] = [d for d in dirs if d != "artifacts"]
+        expected.extend(os.path.join(root, f) for f in files)
+
+    walked = [entry.path for _, entry in walk_files(data_dir, skip_dir=lambda entry: entry.name == "artifacts")]
+
+    assert walked == expected
+
+
+def test_load_json_file_large_document(tmp_path):
+    path = tmp_path / "report.json"
+    measurements = [{"name": f"m{i}", "value": i * 0.5} for i in range(20000)]
+    path.write_text(json.dumps({"measurements": measurements, "score": float("nan")}))
+    assert path.stat().st_size > 256 * 1024
+
+    data = load_json_file(path)
+
+    assert data["measurements"] == measurements
+    assert math.isnan(data["score"])
+
+
+@pytest.mark.parametrize(
+    "timestamp,expected",
+    [
+        ("2025-12-23T08:23:25.7346394Z", datetime(2025, 12, 23, 8, 23, 25, 734639, tzinfo=timezone.utc)),
+        ("2024-12-23T02:56:37.036690+00:00", datetime(2024, 12, 23, 2, 56, 37, 36690, tzinfo=timezone.utc)),
+        (
+            "2024-12-23T02:56:37+05:30",
+            datetime(2024, 12, 23, 2, 56, 37, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        ),
+        ("2024-12-23T02:56:37", datetime(2024, 12, 23, 2, 56, 37)),
+        ("2024-12-23T02:56:37+0000", datetime(2024, 12, 23, 2, 56, 37, tzinfo=timezone.utc)),
+        ("2024-13-23T02:56:37", None),
+        ("2024-12-23", None),
+        ("", None),
+    ],
+)
+def test_parse_timestamp(timestamp, expected):
+    assert parse_timestamp(timestamp) == expected
+
+
+@pytest.mark.parametrize("min_items", [1, 100])
+def test_parallel_map_matches_serial_map(min_items):
+    # min_items=1 forces the process pool, 100 keeps the serial fallback
+    items = [-(i**2) for i in range(20)]
+    expected = list(map(abs, items))
+
+    assert parallel_map(abs, items, min_items=min_items, max_workers=2) == expected
+    assert list(parallel_imap(abs, iter(items), min_items=min_items, max_workers=2)) == expected